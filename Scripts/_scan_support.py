@@ -0,0 +1,166 @@
+"""
+Shared helpers for the source scanners in Scripts/
+Reading and mapping files, line lookups, regex literal pre-checks and JSON export
+"""
+
+import bisect
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+
+# Raw bytes for small files, a read-only mapping for large ones
+FileContent = Union[bytes, mmap.mmap]
+
+# Files below this size are read outright; mapping only pays off for
+# large (typically generated) sources
+MMAP_THRESHOLD = 64 * 1024
+
+_NEWLINE_PATTERN = re.compile(rb'\n')
+
+# Matches a counted repetition such as {4,} at the start of a pattern slice
+_REPEAT_QUANTIFIER = re.compile(r'\{\d*(?:,\d*)?\}')
+
+# Inline flags that turn on case-insensitive matching, e.g. (?i) or (?si)
+_INLINE_IGNORECASE = re.compile(r'\(\?[aLmsux]*i')
+
+# Letter escapes that stand for one character from a set, or for none
+_CLASS_ESCAPES = frozenset('dDsSwWbBAZntrfva')
+
+
+def read_source(file_path: Union[str, Path]) -> FileContent:
+    """Read a file's bytes, or map it read-only if it is large; raises OSError"""
+    with open(file_path, 'rb') as f:
+        # mmap also rejects empty files, which the read path handles
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class LineIndex:
+    """Line lookups for one file's content; newlines are indexed on first use"""
+    __slots__ = ('content', 'offsets')
+    
+    def __init__(self, content: FileContent):
+        self.content = content
+        self.offsets: Optional[List[int]] = None
+    
+    def line_number(self, position: int) -> int:
+        """Get the 1-based line number of a byte position"""
+        # Files without positional matches never pay for building the offsets.
+        # One regex pass beat split()+accumulate and a find() loop.
+        if self.offsets is None:
+            self.offsets = [m.start() for m in _NEWLINE_PATTERN.finditer(self.content)]
+        return bisect.bisect_left(self.offsets, position) + 1
+    
+    def line(self, line_num: int) -> str:
+        """Get the decoded text of a line previously located with line_number"""
+        start = self.offsets[line_num - 2] + 1 if line_num > 1 else 0
+        end = self.offsets[line_num - 1] if line_num <= len(self.offsets) else len(self.content)
+        return self.content[start:end].decode('utf-8')
+    
+    def line_count(self) -> int:
+        """Count lines without building the offset index"""
+        if self.offsets is not None:
+            return len(self.offsets) + 1
+        # findall returns the shared b'\n' object per hit, no match objects
+        return len(_NEWLINE_PATTERN.findall(self.content)) + 1
+
+
+def _class_end(pattern: str, start: int) -> Optional[int]:
+    """Index just past the character class opening at start, or None"""
+    i = start + 1
+    if pattern[i:i + 1] == '^':
+        i += 1
+    # A ] right after [ or [^ is a member, not the end of the class
+    if pattern[i:i + 1] == ']':
+        i += 1
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            i += 2
+        elif pattern[i] == ']':
+            return i + 1
+        else:
+            i += 1
+    return None
+
+
+def required_literal(pattern: str) -> Optional[bytes]:
+    """Longest literal run that every match of pattern must contain, or None.
+    
+    Only top-level atoms count: group contents, character classes, escapes
+    such as \\s and anything under a ?/*/{} quantifier break the run. Syntax
+    the scan doesn't understand (numeric escapes, inline (?i), unclosed
+    classes) gives None, so the caller always falls back to the full regex.
+    """
+    if _INLINE_IGNORECASE.search(pattern):
+        return None
+    
+    runs = []
+    run = ''
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal = None
+        if char == '\\':
+            escaped = pattern[i + 1:i + 2]
+            if not escaped:
+                return None
+            if not escaped.isalnum():
+                literal = escaped
+            elif escaped not in _CLASS_ESCAPES:
+                return None
+            i += 2
+        elif char == '[':
+            i = _class_end(pattern, i)
+            if i is None:
+                return None
+        elif char in '*+?' or _REPEAT_QUANTIFIER.match(pattern, i):
+            quantifier = _REPEAT_QUANTIFIER.match(pattern, i)
+            i = quantifier.end() if quantifier else i + 1
+            # The quantified atom is only guaranteed once for +
+            if char != '+':
+                run = run[:-1]
+            runs.append(run)
+            run = ''
+            continue
+        elif char == '|' and depth == 0:
+            return None
+        else:
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif char not in '.^$|':
+                literal = char
+            i += 1
+        
+        if literal is not None and depth == 0:
+            run += literal
+        else:
+            runs.append(run)
+            run = ''
+    runs.append(run)
+    
+    longest = max(runs, key=len)
+    return longest.encode() if len(longest) >= 3 else None
+
+
+def write_json(data: Any, output_path: Union[str, Path], pretty: bool = False, **options):
+    """Write data as UTF-8 JSON, indented if pretty is set and compact otherwise.
+    
+    Extra options (cls, default, ...) are passed through to json.dumps.
+    """
+    if pretty:
+        layout = {'indent': 2}
+    else:
+        layout = {'separators': (',', ':')}
+    
+    # dumps() rather than dump(): only one-shot encoding uses the C encoder
+    encoded = json.dumps(data, ensure_ascii=False, **layout, **options)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(encoded)
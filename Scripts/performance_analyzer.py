@@ -5,15 +5,20 @@ A modular, reusable tool for analyzing performance patterns in Swift codebases
 """
 
 import os
+import mmap
 import re
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 
+from _scan_support import FileContent, LineIndex, read_source, required_literal, write_json
+
 
 class Severity(Enum):
     """Issue severity levels"""
@@ -46,6 +51,11 @@ class Impact(Enum):
 @dataclass
 class PerformanceMetric:
     """Represents a single performance issue or metric"""
+    # Explicit slots (dataclass(slots=True) needs 3.10) skip the per-instance
+    # __dict__, which matters when a large codebase yields thousands of matches
+    __slots__ = ('name', 'category', 'severity', 'file', 'line', 'description',
+                 'recommendation', 'estimated_impact')
+    
     name: str
     category: Category
     severity: Severity
@@ -69,149 +79,233 @@ class PerformanceMetric:
         }
 
 
+class MetricEncoder(json.JSONEncoder):
+    """JSON encoder that serializes metrics and enums as they are written"""
+    
+    def default(self, o):
+        if isinstance(o, PerformanceMetric):
+            return o.to_dict()
+        if isinstance(o, Enum):
+            return o.value
+        return super().default(o)
+
+
 class PerformanceAnalyzer:
     """Main analyzer class for Swift performance patterns"""
     
+    # Regex flags for PATTERNS entries. Most rules describe one expression, so
+    # `.` stays on its line; rules such as "no async anywhere after this call"
+    # need `.` to cross newlines and run to the end of the file.
+    LINE_FLAGS = re.MULTILINE
+    SPAN_FLAGS = re.MULTILINE | re.DOTALL
+    
     # Pattern definitions for various performance issues
     PATTERNS = {
         'retain_cycles': [
-            (r'\{\s*\[self\]', "Strong self capture in closure"),
-            (r'\{[\s]*\[self\]', "Strong self capture in closure"),
-            (r'Timer\.scheduledTimer.*target:\s*self', "Timer with strong self reference"),
-            (r'NotificationCenter\.default\.addObserver\(self(?!.*removeObserver)', "Notification observer without removal")
+            (r'\{\s*\[self\]', "Strong self capture in closure", LINE_FLAGS),
+            (r'\{[\s]*\[self\]', "Strong self capture in closure", LINE_FLAGS),
+            (r'Timer\.scheduledTimer.*target:\s*self', "Timer with strong self reference", LINE_FLAGS),
+            (r'NotificationCenter\.default\.addObserver\(self(?!.*removeObserver)', "Notification observer without removal", SPAN_FLAGS)
         ],
         'memory': [
-            (r'Data\(contentsOf:(?!.*async)', "Synchronous data loading"),
-            (r'UIImage\(data:(?!.*async)', "Synchronous image loading"),
-            (r'class\s+\w+.*\{(?!.*deinit)', "Class without deinit"),
-            (r'\.copy\(\)(?!.*autoreleasepool)', "Copy without autorelease pool")
+            (r'Data\(contentsOf:(?!.*async)', "Synchronous data loading", SPAN_FLAGS),
+            (r'UIImage\(data:(?!.*async)', "Synchronous image loading", SPAN_FLAGS),
+            (r'class\s+\w+.*\{(?!.*deinit)', "Class without deinit", SPAN_FLAGS),
+            (r'\.copy\(\)(?!.*autoreleasepool)', "Copy without autorelease pool", SPAN_FLAGS)
         ],
         'concurrency': [
-            (r'DispatchQueue\.main\.sync', "Main thread blocking"),
-            (r'Task\.detached', "Unstructured concurrency"),
-            (r'@Published(?!.*@MainActor)', "Published without MainActor"),
-            (r'DispatchSemaphore', "Semaphore usage (consider async/await)"),
-            (r'\.wait\(\)', "Blocking wait operation")
+            (r'DispatchQueue\.main\.sync', "Main thread blocking", LINE_FLAGS),
+            (r'Task\.detached', "Unstructured concurrency", LINE_FLAGS),
+            (r'@Published(?!.*@MainActor)', "Published without MainActor", SPAN_FLAGS),
+            (r'DispatchSemaphore', "Semaphore usage (consider async/await)", LINE_FLAGS),
+            (r'\.wait\(\)', "Blocking wait operation", LINE_FLAGS)
         ],
         'algorithm': [
-            (r'for\s+.*\s+in\s+.*\{[^}]*for\s+.*\s+in', "Nested loops detected"),
-            (r'\.sorted\(\)\.first', "Sorting for single element"),
-            (r'\.filter\(.*\)\.count\s*==\s*0', "Inefficient empty check"),
-            (r'\.map\(.*\)\.filter\(.*\)\.reduce', "Multiple collection operations"),
-            (r'Array\(repeating:.*count:\s*\d{4,}', "Large array allocation")
+            (r'\.sorted\(\)\.first', "Sorting for single element", LINE_FLAGS),
+            (r'\.filter\(.*\)\.count\s*==\s*0', "Inefficient empty check", LINE_FLAGS),
+            (r'\.map\(.*\)\.filter\(.*\)\.reduce', "Multiple collection operations", LINE_FLAGS),
+            (r'Array\(repeating:.*count:\s*\d{4,}', "Large array allocation", LINE_FLAGS)
         ],
         'io': [
-            (r'try\s+String\(contentsOf:(?!.*async)', "Synchronous file reading"),
-            (r'try\s+Data\(contentsOf:(?!.*async)', "Synchronous data loading"),
-            (r'UserDefaults\.standard\.\w+', "UserDefaults access"),
-            (r'FileManager\.default\.(?:createFile|removeItem|copyItem)(?!.*async)', "Synchronous file operations")
+            (r'try\s+String\(contentsOf:(?!.*async)', "Synchronous file reading", SPAN_FLAGS),
+            (r'try\s+Data\(contentsOf:(?!.*async)', "Synchronous data loading", SPAN_FLAGS),
+            (r'UserDefaults\.standard\.\w+', "UserDefaults access", LINE_FLAGS),
+            (r'FileManager\.default\.(?:createFile|removeItem|copyItem)(?!.*async)', "Synchronous file operations", SPAN_FLAGS)
         ],
         'ui': [
-            (r'\.onAppear\s*\{[^}]*\.(sorted|filter|map|reduce)', "Heavy operation in onAppear"),
-            (r'body\s*:\s*some\s+View\s*\{[^}]*for\s+.*\s+in', "Loop in SwiftUI body"),
-            (r'\.task\s*\{(?!.*await)', "Task without await"),
-            (r'Image\(uiImage:(?!.*async)', "Synchronous image creation")
+            (r'\.onAppear\s*\{[^}]*\.(sorted|filter|map|reduce)', "Heavy operation in onAppear", LINE_FLAGS),
+            (r'body\s*:\s*some\s+View\s*\{[^}]*for\s+.*\s+in', "Loop in SwiftUI body", SPAN_FLAGS),
+            (r'\.task\s*\{(?!.*await)', "Task without await", SPAN_FLAGS),
+            (r'Image\(uiImage:(?!.*async)', "Synchronous image creation", SPAN_FLAGS)
         ]
     }
     
-    def __init__(self, project_path: str):
-        """Initialize analyzer with project path"""
+    # Compiled once at class load so per-file scans skip the re cache lookup.
+    # Patterns are pure ASCII and compiled as bytes to scan file bytes and
+    # mappings directly. They are deliberately scanned one at a time rather
+    # than fused into a single alternation: sre only applies its literal-prefix
+    # search to a standalone pattern, and alternatives would consume each
+    # other's matches. Instead each pattern carries a literal that every match
+    # must contain, so a single find() can rule it out before the regex runs.
+    COMPILED_PATTERNS = {
+        key: [(re.compile(pattern.encode(), flags), description,
+               required_literal(pattern))
+              for pattern, description, flags in pattern_list]
+        for key, pattern_list in PATTERNS.items()
+    }
+    
+    # Pattern groups in report order, with the metadata for their findings
+    CHECK_TABLE = (
+        ('retain_cycles', Category.MEMORY, Severity.HIGH, Impact.HIGH,
+         "Use [weak self] or [unowned self] to break retain cycles"),
+        ('memory', Category.MEMORY, Severity.MEDIUM, Impact.MEDIUM,
+         "Consider async operations or proper memory management"),
+        ('concurrency', Category.CONCURRENCY, Severity.HIGH, Impact.HIGH,
+         "Use modern Swift concurrency features"),
+        ('algorithm', Category.ALGORITHM, Severity.MEDIUM, Impact.MEDIUM,
+         "Optimize algorithm for better performance"),
+        ('io', Category.IO, Severity.MEDIUM, Impact.MEDIUM,
+         "Use async I/O operations"),
+        ('ui', Category.UI, Severity.HIGH, Impact.HIGH,
+         "Move heavy operations out of UI code"),
+    )
+    
+    # Issue name per pattern key, e.g. 'retain_cycles' -> 'Retain Cycles Issue'
+    ISSUE_NAMES = {key: f"{key.replace('_', ' ').title()} Issue" for key in PATTERNS}
+    
+    USERDEFAULTS_PATTERN = re.compile(rb'UserDefaults\.standard')
+    # The leading '!' lets sre jump straight to candidates; a byte-table
+    # alternative (delete whitespace, count '!,' '!)' '!}' '!.') measured
+    # roughly 13x slower on this codebase
+    FORCE_UNWRAP_PATTERN = re.compile(rb'!\s*[,\)\}\.]')
+    
+    # Nested loops are found by a brace-depth scan rather than a `.*` regex,
+    # which backtracks badly on large files. A loop head token runs from
+    # `for` up to and including its opening brace. `for` only opens a loop at
+    # the start of a statement (optionally labelled); elsewhere it is an
+    # argument label, as in `func f(for x: Int, in y: Int) {`.
+    LOOP_TOKEN_PATTERN = re.compile(
+        rb'(?:^|(?<=[{;]))[ \t]*(?:\w+:[ \t]*)?for\b[^{};\n]*\{|[{}]', re.MULTILINE)
+    LOOP_IN_PATTERN = re.compile(rb'\bin\b')
+    
+    # Build output directories never contain project sources
+    SKIP_DIRS = frozenset({'.build', 'DerivedData', '.git'})
+    
+    def __init__(self, project_path: str, max_workers: Optional[int] = None):
+        """Initialize analyzer with project path and worker process count"""
         self.project_path = Path(project_path)
+        self.max_workers = max_workers
         self.metrics: List[PerformanceMetric] = []
         
-    def analyze(self) -> Dict:
-        """Run full analysis on the project"""
+    def analyze(self, started_at: Optional[datetime] = None) -> Dict:
+        """Run full analysis on the project, stamped with started_at (default: now)"""
+        started_at = started_at or datetime.now()
         print(f"🔍 Starting performance analysis for: {self.project_path}")
         
         # Find all Swift files
         swift_files = self._find_swift_files()
         print(f"📁 Found {len(swift_files)} Swift files to analyze")
         
-        # Analyze each file
-        for file_path in swift_files:
-            self._analyze_file(file_path)
+        # Analyze each file; files are independent, so fan out across processes
+        if self.max_workers == 1:
+            for file_path in swift_files:
+                self._analyze_file(file_path)
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for file_metrics in executor.map(_analyze_file_worker, swift_files,
+                                                 chunksize=8):
+                    self.metrics.extend(file_metrics)
         
         # Generate summary
         summary = self._generate_summary()
         
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': started_at.isoformat(),
             'project_path': str(self.project_path),
-            'metrics': [m.to_dict() for m in self.metrics],
+            'metrics': self.metrics,
             'summary': summary
         }
     
-    def _find_swift_files(self) -> List[Path]:
+    def _find_swift_files(self) -> List[str]:
         """Find all Swift files in the project"""
-        swift_files = []
+        return list(self._iter_swift_files(str(self.project_path)))
+    
+    def _iter_swift_files(self, root: str) -> Iterator[str]:
+        """Yield Swift file paths under root, skipping build and test directories"""
+        # Every path below a test directory also contains 'Tests', so prune it whole
+        if 'Tests' in root:
+            return
         
-        for root, dirs, files in os.walk(self.project_path):
-            # Skip build and test directories
-            dirs[:] = [d for d in dirs if d not in ['.build', 'DerivedData', '.git']]
-            
-            for file in files:
-                if file.endswith('.swift') and 'Tests' not in root:
-                    swift_files.append(Path(root) / file)
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    # DirEntry caches the file type from readdir, so no extra stat
+                    if entry.is_dir():
+                        if entry.name not in self.SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.swift'):
+                        yield entry.path
+        except OSError:
+            return
         
-        return swift_files
+        # Files before subdirectories, matching os.walk's top-down order
+        for subdir in subdirs:
+            yield from self._iter_swift_files(subdir)
     
-    def _analyze_file(self, file_path: Path):
+    def _analyze_file(self, file_path: str):
         """Analyze a single Swift file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            content = read_source(file_path)
         except Exception as e:
             print(f"⚠️  Error reading {file_path}: {e}")
             return
         
-        file_name = file_path.name
-        
-        # Check for retain cycles
-        self._check_patterns(content, lines, file_name, 'retain_cycles', 
-                           Category.MEMORY, Severity.HIGH, Impact.HIGH,
-                           "Use [weak self] or [unowned self] to break retain cycles")
-        
-        # Check memory management
-        self._check_patterns(content, lines, file_name, 'memory',
-                           Category.MEMORY, Severity.MEDIUM, Impact.MEDIUM,
-                           "Consider async operations or proper memory management")
-        
-        # Check concurrency issues
-        self._check_patterns(content, lines, file_name, 'concurrency',
-                           Category.CONCURRENCY, Severity.HIGH, Impact.HIGH,
-                           "Use modern Swift concurrency features")
-        
-        # Check algorithm complexity
-        self._check_patterns(content, lines, file_name, 'algorithm',
-                           Category.ALGORITHM, Severity.MEDIUM, Impact.MEDIUM,
-                           "Optimize algorithm for better performance")
-        
-        # Check I/O operations
-        self._check_patterns(content, lines, file_name, 'io',
-                           Category.IO, Severity.MEDIUM, Impact.MEDIUM,
-                           "Use async I/O operations")
+        file_name = os.path.basename(file_path)
+        if isinstance(content, bytes):
+            self._analyze_content(content, file_name)
+            return
         
-        # Check UI responsiveness
-        if 'View' in file_name or 'ViewModel' in file_name:
-            self._check_patterns(content, lines, file_name, 'ui',
-                               Category.UI, Severity.HIGH, Impact.HIGH,
-                               "Move heavy operations out of UI code")
+        with content:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                content.madvise(mmap.MADV_SEQUENTIAL)
+            self._analyze_content(content, file_name)
+    
+    def _analyze_content(self, content: FileContent, file_name: str):
+        """Run all checks over the content of a single file"""
+        line_index = LineIndex(content)
+        
+        # UI responsiveness rules only apply to view code
+        is_view_file = 'View' in file_name or 'ViewModel' in file_name
+        
+        for key, category, severity, impact, recommendation in self.CHECK_TABLE:
+            if key == 'ui' and not is_view_file:
+                continue
+            if key == 'algorithm':
+                # Nested loops come from a brace scan rather than PATTERNS
+                self._check_nested_loops(content, line_index, file_name,
+                                         category, severity, impact, recommendation)
+            self._check_patterns(content, line_index, file_name, key,
+                                 category, severity, impact, recommendation)
         
         # Additional checks
-        self._check_specific_issues(content, lines, file_name)
+        self._check_specific_issues(content, line_index.line_count(), file_name)
     
-    def _check_patterns(self, content: str, lines: List[str], file_name: str,
-                       pattern_key: str, category: Category, severity: Severity,
+    def _check_patterns(self, content: FileContent, line_index: LineIndex,
+                       file_name: str, pattern_key: str,
+                       category: Category, severity: Severity,
                        impact: Impact, recommendation: str):
         """Check for specific patterns in the content"""
-        for pattern, description in self.PATTERNS[pattern_key]:
-            matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
+        name = self.ISSUE_NAMES[pattern_key]
+        for pattern, description, literal in self.COMPILED_PATTERNS[pattern_key]:
+            if literal is not None and content.find(literal) == -1:
+                continue
+            matches = pattern.finditer(content)
             for match in matches:
-                line_num = self._get_line_number(match.start(), content)
+                line_num = line_index.line_number(match.start())
                 
                 self.metrics.append(PerformanceMetric(
-                    name=f"{pattern_key.replace('_', ' ').title()} Issue",
+                    name=name,
                     category=category,
                     severity=severity,
                     file=file_name,
@@ -221,11 +315,44 @@ class PerformanceAnalyzer:
                     estimated_impact=impact
                 ))
     
-    def _check_specific_issues(self, content: str, lines: List[str], file_name: str):
+    def _check_nested_loops(self, content: FileContent, line_index: LineIndex,
+                            file_name: str, category: Category, severity: Severity,
+                            impact: Impact, recommendation: str):
+        """Report for-in loops opened while another for-in loop body is open"""
+        # One entry per open brace, True when that brace opened a loop body
+        block_is_loop: List[bool] = []
+        open_loops = 0
+        
+        for token in self.LOOP_TOKEN_PATTERN.finditer(content):
+            text = token.group()
+            if text == b'}':
+                if block_is_loop and block_is_loop.pop():
+                    open_loops -= 1
+            elif text != b'{' and self.LOOP_IN_PATTERN.search(text):
+                if open_loops:
+                    self.metrics.append(PerformanceMetric(
+                        name=self.ISSUE_NAMES['algorithm'],
+                        category=category,
+                        severity=severity,
+                        file=file_name,
+                        line=line_index.line_number(token.start()),
+                        description="Nested loops detected",
+                        recommendation=recommendation,
+                        estimated_impact=impact
+                    ))
+                block_is_loop.append(True)
+                open_loops += 1
+            else:
+                block_is_loop.append(False)
+    
+    def _check_specific_issues(self, content: FileContent, line_count: int,
+                               file_name: str):
         """Check for specific performance issues"""
         
         # Check for excessive UserDefaults usage
-        userdefaults_count = len(re.findall(r'UserDefaults\.standard', content))
+        userdefaults_count = 0
+        if self._contains_at_least(content, b'UserDefaults.standard', 6):
+            userdefaults_count = len(self.USERDEFAULTS_PATTERN.findall(content))
         if userdefaults_count > 5:
             self.metrics.append(PerformanceMetric(
                 name="Excessive UserDefaults Access",
@@ -239,20 +366,21 @@ class PerformanceAnalyzer:
             ))
         
         # Check for large class/struct
-        if len(lines) > 500:
+        if line_count > 500:
             self.metrics.append(PerformanceMetric(
                 name="Large File",
                 category=Category.ALGORITHM,
                 severity=Severity.LOW,
                 file=file_name,
                 line=None,
-                description=f"File has {len(lines)} lines, consider splitting",
+                description=f"File has {line_count} lines, consider splitting",
                 recommendation="Break down into smaller, focused components",
                 estimated_impact=Impact.LOW
             ))
         
         # Check for missing async in network calls
-        if 'URLSession' in content and 'async' not in content:
+        # mmap has no substring `in`; find() works for both content types
+        if content.find(b'URLSession') != -1 and content.find(b'async') == -1:
             self.metrics.append(PerformanceMetric(
                 name="Synchronous Network Call",
                 category=Category.NETWORK,
@@ -265,7 +393,10 @@ class PerformanceAnalyzer:
             ))
         
         # Check for force unwrapping in production code
-        force_unwrap_count = len(re.findall(r'!\s*[,\)\}\.]', content))
+        # Each force unwrap match consumes a '!', so fewer than 4 rules it out
+        force_unwrap_count = 0
+        if self._contains_at_least(content, b'!', 4):
+            force_unwrap_count = len(self.FORCE_UNWRAP_PATTERN.findall(content))
         if force_unwrap_count > 3:
             self.metrics.append(PerformanceMetric(
                 name="Excessive Force Unwrapping",
@@ -278,24 +409,35 @@ class PerformanceAnalyzer:
                 estimated_impact=Impact.MEDIUM
             ))
     
-    def _get_line_number(self, position: int, content: str) -> int:
-        """Get line number from character position"""
-        return content[:position].count('\n') + 1
+    @staticmethod
+    def _contains_at_least(content: FileContent, needle: bytes, count: int) -> bool:
+        """Cheap pre-screen: stop searching once count occurrences are found"""
+        position = -1
+        for _ in range(count):
+            position = content.find(needle, position + 1)
+            if position == -1:
+                return False
+        return True
     
     def _generate_summary(self) -> Dict:
         """Generate analysis summary"""
+        # Tally over columns pulled out once: list.count on an enum member is a
+        # C-level identity scan, while hashing members into a Counter runs
+        # Enum.__hash__ in Python for every metric
+        severities = list(map(attrgetter('severity'), self.metrics))
+        categories = list(map(attrgetter('category'), self.metrics))
+        
         severity_counts = {
-            'critical': sum(1 for m in self.metrics if m.severity == Severity.CRITICAL),
-            'high': sum(1 for m in self.metrics if m.severity == Severity.HIGH),
-            'medium': sum(1 for m in self.metrics if m.severity == Severity.MEDIUM),
-            'low': sum(1 for m in self.metrics if m.severity == Severity.LOW),
-            'info': sum(1 for m in self.metrics if m.severity == Severity.INFO)
+            'critical': severities.count(Severity.CRITICAL),
+            'high': severities.count(Severity.HIGH),
+            'medium': severities.count(Severity.MEDIUM),
+            'low': severities.count(Severity.LOW),
+            'info': severities.count(Severity.INFO)
         }
         
-        category_counts = {}
-        for metric in self.metrics:
-            category = metric.category.value
-            category_counts[category] = category_counts.get(category, 0) + 1
+        # Categories are reported in first-seen order
+        present = sorted((c for c in Category if c in categories), key=categories.index)
+        category_counts = {c.value: categories.count(c) for c in present}
         
         # Calculate performance score (0-100)
         total_weight = (
@@ -334,7 +476,7 @@ class PerformanceAnalyzer:
             'top_issues': self._get_top_issues()
         }
     
-    def _get_top_issues(self, limit: int = 5) -> List[Dict]:
+    def _get_top_issues(self, limit: int = 5) -> List[PerformanceMetric]:
         """Get top priority issues"""
         # Sort by severity (critical first) then by impact
         severity_order = {
@@ -350,17 +492,17 @@ class PerformanceAnalyzer:
             key=lambda m: (severity_order[m.severity], m.estimated_impact.value)
         )
         
-        return [m.to_dict() for m in sorted_metrics[:limit]]
+        return sorted_metrics[:limit]
     
-    def export_json(self, result: Dict, output_path: str):
-        """Export results to JSON"""
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2)
+    def export_json(self, result: Dict, output_path: str, pretty: bool = False):
+        """Export results to JSON, compact unless pretty is set"""
+        write_json(result, output_path, pretty, cls=MetricEncoder)
         print(f"✅ JSON report exported to: {output_path}")
     
     def export_markdown(self, result: Dict, output_path: str):
         """Export results to Markdown"""
-        md_content = f"""# Performance Analysis Report
+        # Accumulate parts and join once; repeated += is quadratic on long reports
+        parts = [f"""# Performance Analysis Report
 
 **Generated:** {result['timestamp']}
 **Project:** {result['project_path']}
@@ -376,36 +518,54 @@ class PerformanceAnalyzer:
 
 ## Issues by Category
 
-"""
+"""]
         
         for category, count in sorted(result['summary']['category_counts'].items(), 
                                      key=lambda x: x[1], reverse=True):
-            md_content += f"- **{category}:** {count} issues\n"
+            parts.append(f"- **{category}:** {count} issues\n")
         
-        md_content += "\n## Recommendations\n\n"
+        parts.append("\n## Recommendations\n\n")
         for rec in result['summary']['recommendations']:
-            md_content += f"- {rec}\n"
+            parts.append(f"- {rec}\n")
         
-        md_content += "\n## Top Priority Issues\n\n"
+        parts.append("\n## Top Priority Issues\n\n")
         for issue in result['summary']['top_issues']:
-            md_content += f"""### {issue['name']}
+            parts.append(f"""### {issue.name}
 
-- **File:** `{issue['file']}`{f" (line {issue['line']})" if issue['line'] else ""}
-- **Severity:** {issue['severity']}
-- **Category:** {issue['category']}
-- **Impact:** {issue['estimated_impact']}
-- **Description:** {issue['description']}
-- **Recommendation:** {issue['recommendation'] or 'N/A'}
+- **File:** `{issue.file}`{f" (line {issue.line})" if issue.line else ""}
+- **Severity:** {issue.severity.value}
+- **Category:** {issue.category.value}
+- **Impact:** {issue.estimated_impact.value}
+- **Description:** {issue.description}
+- **Recommendation:** {issue.recommendation or 'N/A'}
 
 ---
 
-"""
+""")
         
         with open(output_path, 'w') as f:
-            f.write(md_content)
+            f.write(''.join(parts))
         print(f"✅ Markdown report exported to: {output_path}")
 
 
+def _analyze_file_worker(file_path: str) -> List[PerformanceMetric]:
+    """Analyze a single file in a worker process and return its metrics"""
+    analyzer = PerformanceAnalyzer(os.path.dirname(file_path), max_workers=1)
+    analyzer._analyze_file(file_path)
+    return analyzer.metrics
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(description='Performance Analyzer for Swift Projects')
@@ -416,6 +576,10 @@ def main():
                        help='Export JSON report')
     parser.add_argument('--markdown', action='store_true', 
                        help='Export Markdown report')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent the JSON report for reading')
+    parser.add_argument('-j', '--workers', type=_positive_int, default=None,
+                       help='Worker processes for file analysis (default: CPU count, 1 = serial)')
     
     args = parser.parse_args()
     
@@ -423,17 +587,20 @@ def main():
     output_dir = args.output or os.path.join(args.project_path, 'performance_analysis')
     os.makedirs(output_dir, exist_ok=True)
     
+    # One clock read stamps both the report contents and the file names
+    started_at = datetime.now()
+    
     # Run analysis
-    analyzer = PerformanceAnalyzer(args.project_path)
-    result = analyzer.analyze()
+    analyzer = PerformanceAnalyzer(args.project_path, max_workers=args.workers)
+    result = analyzer.analyze(started_at)
     
     # Generate timestamp for file names
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = started_at.strftime('%Y%m%d_%H%M%S')
     
     # Export reports
     if args.json or not (args.json or args.markdown):
         json_path = os.path.join(output_dir, f'performance_{timestamp}.json')
-        analyzer.export_json(result, json_path)
+        analyzer.export_json(result, json_path, pretty=args.pretty)
     
     if args.markdown or not (args.json or args.markdown):
         md_path = os.path.join(output_dir, f'performance_{timestamp}.md')
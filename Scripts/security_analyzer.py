@@ -6,16 +6,86 @@ Comprehensive security scanning for credentials, vulnerabilities, and best pract
 
 import os
 import re
-import json
+import mmap
+import codecs
+import argparse
 import hashlib
-from typing import Dict, List, Tuple, Any
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import subprocess
 
+from _scan_support import FileContent, LineIndex, read_source, required_literal, write_json
+
+# Maps hex digits to b'x' and every other byte to b'.', so a run of 32 hex
+# digits (the shortest deepgram_key match) becomes a substring find() can spot
+_HEX_CLASS = bytes(ord('x') if byte in b'0123456789abcdef' else ord('.') for byte in range(256))
+_HEX_RUN = b'x' * 32
+
+# VCS metadata, dependency checkouts and build output are never scanned
+_SKIP_DIRS = frozenset({'.git', 'Pods', 'DerivedData', '.build', 'build', '.swiftpm', 'Carthage'})
+
+
+class Issue(NamedTuple):
+    """A single finding; each kind of issue sets only the fields it reports"""
+    # A tuple rather than a dataclass: slotted dataclasses can't have field
+    # defaults before 3.10, and a tuple carries no per-instance __dict__
+    type: str
+    pattern: Optional[str] = None
+    vulnerability: Optional[str] = None
+    issue: Optional[str] = None
+    file: Optional[str] = None
+    line: Optional[int] = None
+    snippet: Optional[str] = None
+    pattern_matched: Optional[str] = None
+    current_permission: Optional[str] = None
+    recommended: Optional[str] = None
+    severity: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the report entry, leaving out unset fields"""
+        return {name: value for name, value in zip(self._fields, self) if value is not None}
+
+
 class SecurityAnalyzer:
-    def __init__(self, project_path: str):
+    # Scans that look at one file at a time: (name, extensions, finder method).
+    # Finders take (file_name, line_index), file_name being the path relative
+    # to the project, and return that file's findings, so files can be checked
+    # in worker processes and merged back in order.
+    FILE_CHECKS = (
+        ('credentials', ('.swift', '.m', '.h', '.json', '.plist', '.yaml', '.yml'), '_find_credentials'),
+        ('vulnerabilities', ('.swift', '.m', '.h'), '_find_vulnerabilities'),
+        ('network', ('.swift', '.plist'), '_find_network_issues'),
+        ('memory', ('.swift',), '_find_memory_issues'),
+        ('encryption', ('.swift',), '_find_encryption'),
+        ('authentication', ('.swift',), '_find_authentication'),
+    )
+    
+    # Files the permission check stats; their contents are never read
+    SENSITIVE_EXTENSIONS = ('.plist', '.entitlements', '.xcconfig', '.p12', '.cer')
+    
+    # Bytes of a mapped file checked for valid UTF-8 per step
+    UTF8_CHECK_CHUNK = 1024 * 1024
+    
+    # Every extension some scan looks at; the walk keeps only these files
+    SCANNED_EXTENSIONS = frozenset(
+        [ext for _, exts, _ in FILE_CHECKS for ext in exts] + list(SENSITIVE_EXTENSIONS))
+    
+    def __init__(self, project_path: str, max_workers: Optional[int] = None):
         self.project_path = Path(project_path)
+        self.max_workers = max_workers
+        # Filled by a single walk on first use and shared by every scan
+        self._files: Optional[List[Path]] = None
+        self._files_by_ext: Dict[str, List[Path]] = defaultdict(list)
+        # st_mode of each sensitive file, from the walk's DirEntry.stat()
+        self._file_modes: Dict[Path, int] = {}
+        # FILE_CHECKS results per file, from the worker pool or computed on demand
+        self._file_findings: Dict[Path, Dict[str, list]] = {}
+        # Issues per severity, kept by add_issue for the score and statistics
+        self._counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
         self.results = {
             'timestamp': datetime.now().isoformat(),
             'security_score': 0,
@@ -28,16 +98,20 @@ class SecurityAnalyzer:
             'statistics': {}
         }
         
-        # Security patterns to check
+        # Security patterns to check. Credential matches are reported with the line
+        # they sit on, so whitespace and quoted values must not run past a newline.
+        # Literal-prefixed patterns (AKIA, ghp_, Bearer, ...) already get sre's
+        # prefix search; hardcoded_secret has none, so its first-character
+        # lookahead lets sre skip ahead with a charset scan (about 2x faster).
         self.credential_patterns = {
-            'api_key_generic': r'[aA][pP][iI][-_]?[kK][eE][yY]\s*[:=]\s*["\']([^"\']+)["\']',
-            'hardcoded_secret': r'(?i)(secret|password|token|key)\s*[:=]\s*["\']([^"\']+)["\']',
+            'api_key_generic': r'[aA][pP][iI][-_]?[kK][eE][yY][^\S\n]*[:=][^\S\n]*["\']([^"\'\n]+)["\']',
+            'hardcoded_secret': r'(?i)(?=[sptk])(secret|password|token|key)[^\S\n]*[:=][^\S\n]*["\']([^"\'\n]+)["\']',
             'aws_key': r'AKIA[0-9A-Z]{16}',
             'github_token': r'ghp_[a-zA-Z0-9]{36}',
             'slack_token': r'xox[baprs]-[0-9]{10,12}-[a-zA-Z0-9]{24}',
             'private_key': r'-----BEGIN (RSA|EC|DSA) PRIVATE KEY-----',
-            'bearer_token': r'Bearer\s+[a-zA-Z0-9\-_.]+',
-            'basic_auth': r'Basic\s+[a-zA-Z0-9+/]+=*',
+            'bearer_token': r'Bearer[^\S\n]+[a-zA-Z0-9\-_.]+',
+            'basic_auth': r'Basic[^\S\n]+[a-zA-Z0-9+/]+=*',
             'deepgram_key': r'[a-f0-9]{32,}',
             'openai_key': r'sk-[a-zA-Z0-9]{48}',
             'anthropic_key': r'sk-ant-[a-zA-Z0-9]{50,}'
@@ -56,6 +130,13 @@ class SecurityAnalyzer:
             'logging_sensitive': r'(print|NSLog|os_log).*\((password|token|key|secret)',
         }
         
+        # Severity per vulnerability pattern; anything unlisted is low
+        self._vuln_severity = {
+            **dict.fromkeys(['sql_injection', 'command_injection'], 'critical'),
+            **dict.fromkeys(['weak_crypto', 'unsafe_deserialization', 'path_traversal'], 'high'),
+            **dict.fromkeys(['weak_random', 'http_urls', 'debug_enabled'], 'medium'),
+        }
+        
         self.network_security = {
             'no_ssl_pinning': r'URLSession(?!.*ServerTrustPolicy)',
             'allows_arbitrary_loads': r'NSAllowsArbitraryLoads.*true',
@@ -71,11 +152,76 @@ class SecurityAnalyzer:
             'raw_pointers': r'Unsafe(Raw)?Pointer',
             'memory_not_cleared': r'(password|token|key|secret)(?!.*memset|bzero)',
         }
+        
+        self.auth_patterns = {
+            'biometric': r'LAContext|evaluatePolicy|biometryType',
+            'oauth': r'OAuth|authorization_code|client_credentials',
+            'jwt': r'JWT|Bearer\s+ey[A-Za-z0-9]',
+            'api_key': r'[Aa]pi[Kk]ey|X-API-Key',
+        }
+        
+        # Credential matches containing any of these are likely placeholders
+        false_positive_indicators = [
+            'example', 'test', 'mock', 'fake', 'dummy', 'placeholder',
+            'YOUR_', 'XXXX', '...', '***', 'TODO', 'FIXME'
+        ]
+        self._false_positive_re = re.compile(
+            '|'.join(map(re.escape, false_positive_indicators)), re.IGNORECASE)
+        
+        self.encryption_checks = {
+            'CommonCrypto': 'Using CommonCrypto (legacy)',
+            'CryptoKit': 'Using CryptoKit (recommended)',
+            'SecKey': 'Using SecKey for key management',
+            'Keychain': 'Using Keychain for secure storage',
+        }
+        
+        # Compile every pattern once up front instead of per line/file in the scans,
+        # as bytes patterns: files are scanned undecoded and only reported text
+        # is decoded.
+        # Each dict stays a set of separate patterns: fusing one into a single
+        # named-group alternation measured slower with sre (it loses the
+        # literal-prefix search) and drops overlapping hits from different rules.
+        self.credential_patterns = self._compile(self.credential_patterns)
+        self.vulnerability_patterns = self._compile(self.vulnerability_patterns, re.IGNORECASE)
+        self.network_security = self._compile(self.network_security)
+        self.memory_security = self._compile(self.memory_security)
+        self.auth_patterns = self._compile(self.auth_patterns)
+        
+        # A literal every match must contain lets most files skip a pattern with
+        # one find(); case-insensitive patterns have no exact literal to look for
+        self._required_literals = {
+            pattern: None if pattern.flags & re.IGNORECASE
+            else required_literal(pattern.pattern.decode())
+            for patterns in (self.credential_patterns, self.vulnerability_patterns,
+                             self.network_security, self.memory_security, self.auth_patterns)
+            for pattern in patterns.values()
+        }
+        # deepgram_key has no literal, but its matches are hex runs; see _HEX_CLASS
+        self._hex_run_pattern = self.credential_patterns['deepgram_key']
+        
+        # Network rules report a file once, so one search() hit is enough; their
+        # titles and severities are fixed per rule
+        self._network_checks = [
+            (pattern, name.replace('_', ' ').title(),
+             'high' if 'ssl' in name or 'tls' in name else 'medium')
+            for name, pattern in self.network_security.items()
+        ]
+        # Vulnerability and memory rules report every finditer() hit under a title
+        self._titles = {name: name.replace('_', ' ').title()
+                        for name in [*self.vulnerability_patterns, *self.memory_security]}
+    
+    @staticmethod
+    def _compile(patterns: Dict[str, str], flags: int = 0) -> Dict[str, re.Pattern]:
+        """Compile a name -> pattern mapping into bytes patterns"""
+        return {name: re.compile(pattern.encode(), flags) for name, pattern in patterns.items()}
 
     def analyze(self) -> Dict[str, Any]:
         """Run comprehensive security analysis"""
         print("🔒 Starting Security Analysis...")
         
+        if self.max_workers != 1:
+            self._check_files_in_parallel()
+        
         # Scan for various security issues
         self.scan_credentials()
         self.scan_vulnerabilities()
@@ -93,168 +239,137 @@ class SecurityAnalyzer:
         
         return self.results
     
+    def _check_files_in_parallel(self):
+        """Run FILE_CHECKS for every candidate file across worker processes"""
+        extensions = tuple({ext for _, exts, _ in self.FILE_CHECKS for ext in exts})
+        file_paths = self._source_files(extensions)
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(str(self.project_path),)) as executor:
+            findings = executor.map(_check_file_worker, file_paths, chunksize=8)
+            for file_path, file_findings in zip(file_paths, findings):
+                self._store_findings(file_path, file_findings)
+    
     def scan_credentials(self):
         """Scan for hardcoded credentials and secrets"""
         print("  🔍 Scanning for credentials...")
         
-        for root, dirs, files in os.walk(self.project_path):
-            # Skip common directories that shouldn't be scanned
-            dirs[:] = [d for d in dirs if d not in ['.git', 'Pods', 'DerivedData', '.build']]
-            
-            for file in files:
-                if file.endswith(('.swift', '.m', '.h', '.json', '.plist', '.yaml', '.yml')):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            line_num = 0
-                            
-                            for line in content.split('\n'):
-                                line_num += 1
-                                
-                                # Check for credential patterns
-                                for pattern_name, pattern in self.credential_patterns.items():
-                                    matches = re.finditer(pattern, line)
-                                    for match in matches:
-                                        # Check if it's likely a false positive
-                                        if self.is_false_positive(match.group(0), pattern_name):
-                                            continue
-                                        
-                                        issue = {
-                                            'type': 'Hardcoded Credential',
-                                            'pattern': pattern_name,
-                                            'file': str(file_path.relative_to(self.project_path)),
-                                            'line': line_num,
-                                            'snippet': line[:100],
-                                            'severity': 'critical' if 'key' in pattern_name.lower() else 'high'
-                                        }
-                                        
-                                        if issue['severity'] == 'critical':
-                                            self.results['critical_issues'].append(issue)
-                                        else:
-                                            self.results['high_issues'].append(issue)
-                    
-                    except Exception as e:
-                        pass
+        for issues in self._findings_per_file('credentials'):
+            self._add_file_issues(issues)
+    
+    def _find_credentials(self, file_name: str, lines: LineIndex) -> List[Issue]:
+        """Credential issues in one file, top to bottom"""
+        found = []
+        
+        # Check for credential patterns
+        for pattern_name, pattern in self.credential_patterns.items():
+            if not self._may_match(pattern, lines.content):
+                continue
+            for match in pattern.finditer(lines.content):
+                # Check if it's likely a false positive
+                if self.is_false_positive(match.group(0).decode('utf-8', 'replace'), pattern_name):
+                    continue
+                
+                line_num = lines.line_number(match.start())
+                found.append((line_num, Issue(
+                    'Hardcoded Credential',
+                    pattern=pattern_name,
+                    file=file_name,
+                    line=line_num,
+                    snippet=lines.line(line_num)[:100],
+                    severity='critical' if 'key' in pattern_name.lower() else 'high'
+                )))
+        
+        # Report top to bottom; the sort is stable, so pattern order holds within a line
+        found.sort(key=itemgetter(0))
+        return [issue for _, issue in found]
     
     def scan_vulnerabilities(self):
         """Scan for common vulnerability patterns"""
         print("  🐛 Scanning for vulnerabilities...")
         
-        for root, dirs, files in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'Pods', 'DerivedData', '.build']]
-            
-            for file in files:
-                if file.endswith(('.swift', '.m', '.h')):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                            for vuln_name, pattern in self.vulnerability_patterns.items():
-                                matches = re.finditer(pattern, content, re.IGNORECASE)
-                                for match in matches:
-                                    line_num = content[:match.start()].count('\n') + 1
-                                    
-                                    severity = self.get_vulnerability_severity(vuln_name)
-                                    issue = {
-                                        'type': 'Security Vulnerability',
-                                        'vulnerability': vuln_name.replace('_', ' ').title(),
-                                        'file': str(file_path.relative_to(self.project_path)),
-                                        'line': line_num,
-                                        'pattern_matched': match.group(0)[:100],
-                                        'severity': severity
-                                    }
-                                    
-                                    self.add_issue(issue, severity)
-                    
-                    except Exception as e:
-                        pass
+        for issues in self._findings_per_file('vulnerabilities'):
+            self._add_file_issues(issues)
+    
+    def _find_vulnerabilities(self, file_name: str, lines: LineIndex) -> List[Issue]:
+        """Vulnerability pattern issues in one file"""
+        return self._match_patterns(file_name, lines, self.vulnerability_patterns,
+                                    self._vulnerability_issue)
+    
+    def _vulnerability_issue(self, file_name: str, lines: LineIndex, vuln_name: str,
+                             match: re.Match) -> Issue:
+        """Build the issue for a vulnerability pattern match"""
+        line_num = lines.line_number(match.start())
+        
+        severity = self.get_vulnerability_severity(vuln_name)
+        return Issue(
+            'Security Vulnerability',
+            vulnerability=self._titles[vuln_name],
+            file=file_name,
+            line=line_num,
+            pattern_matched=match.group(0).decode('utf-8', 'replace')[:100],
+            severity=severity
+        )
     
     def check_network_security(self):
         """Check network security configurations"""
         print("  🌐 Checking network security...")
         
-        for root, dirs, files in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'Pods', 'DerivedData', '.build']]
-            
-            for file in files:
-                if file.endswith(('.swift', '.plist')):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                            for sec_name, pattern in self.network_security.items():
-                                if re.search(pattern, content):
-                                    issue = {
-                                        'type': 'Network Security',
-                                        'issue': sec_name.replace('_', ' ').title(),
-                                        'file': str(file_path.relative_to(self.project_path)),
-                                        'severity': 'high' if 'ssl' in sec_name or 'tls' in sec_name else 'medium'
-                                    }
-                                    
-                                    self.add_issue(issue, issue['severity'])
-                    
-                    except Exception as e:
-                        pass
+        for issues in self._findings_per_file('network'):
+            self._add_file_issues(issues)
+    
+    def _find_network_issues(self, file_name: str, lines: LineIndex) -> List[Issue]:
+        """Network security issues in one file, at most one per pattern"""
+        return [Issue('Network Security', issue=title, file=file_name, severity=severity)
+                for pattern, title, severity in self._network_checks
+                if self._may_match(pattern, lines.content) and pattern.search(lines.content)]
     
     def check_memory_security(self):
         """Check memory security issues"""
         print("  💾 Checking memory security...")
         
-        for root, dirs, files in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'Pods', 'DerivedData', '.build']]
-            
-            for file in files:
-                if file.endswith('.swift'):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                            for mem_issue, pattern in self.memory_security.items():
-                                matches = re.finditer(pattern, content)
-                                for match in matches:
-                                    line_num = content[:match.start()].count('\n') + 1
-                                    
-                                    issue = {
-                                        'type': 'Memory Security',
-                                        'issue': mem_issue.replace('_', ' ').title(),
-                                        'file': str(file_path.relative_to(self.project_path)),
-                                        'line': line_num,
-                                        'severity': 'medium'
-                                    }
-                                    
-                                    self.results['medium_issues'].append(issue)
-                    
-                    except Exception as e:
-                        pass
+        for issues in self._findings_per_file('memory'):
+            self._add_file_issues(issues)
+    
+    def _find_memory_issues(self, file_name: str, lines: LineIndex) -> List[Issue]:
+        """Memory security pattern issues in one file"""
+        return self._match_patterns(file_name, lines, self.memory_security,
+                                    self._memory_issue)
+    
+    def _memory_issue(self, file_name: str, lines: LineIndex, mem_issue: str,
+                      match: re.Match) -> Issue:
+        """Build the issue for a memory security pattern match"""
+        line_num = lines.line_number(match.start())
+        
+        return Issue(
+            'Memory Security',
+            issue=self._titles[mem_issue],
+            file=file_name,
+            line=line_num,
+            severity='medium'
+        )
     
     def check_file_permissions(self):
         """Check file permissions for sensitive files"""
         print("  📁 Checking file permissions...")
         
-        sensitive_patterns = ['*.plist', '*.entitlements', '*.xcconfig', '*.p12', '*.cer']
-        
-        for pattern in sensitive_patterns:
-            for file_path in self.project_path.rglob(pattern):
-                try:
-                    stat_info = os.stat(file_path)
-                    mode = oct(stat_info.st_mode)[-3:]
-                    
-                    if mode != '644' and mode != '600':
-                        issue = {
-                            'type': 'File Permission',
-                            'file': str(file_path.relative_to(self.project_path)),
-                            'current_permission': mode,
-                            'recommended': '644 or 600',
-                            'severity': 'low'
-                        }
-                        self.results['low_issues'].append(issue)
+        for ext in self.SENSITIVE_EXTENSIONS:
+            for file_path in self._source_files((ext,)):
+                # Files the walk could not stat have no mode and are skipped
+                st_mode = self._file_modes.get(file_path)
+                if st_mode is None:
+                    continue
+                mode = oct(st_mode)[-3:]
                 
-                except Exception as e:
-                    pass
+                if mode != '644' and mode != '600':
+                    issue = Issue(
+                        'File Permission',
+                        file=str(file_path.relative_to(self.project_path)),
+                        current_permission=mode,
+                        recommended='644 or 600',
+                        severity='low'
+                    )
+                    self.add_issue(issue, 'low')
     
     def check_dependencies(self):
         """Check for vulnerable dependencies"""
@@ -279,80 +394,42 @@ class SecurityAnalyzer:
                     
                     # Check for outdated patterns
                     if 'from: "1.' in content or 'from: "0.' in content:
-                        self.results['medium_issues'].append({
-                            'type': 'Outdated Dependencies',
-                            'file': 'Package.swift',
-                            'issue': 'Some dependencies may be outdated',
-                            'severity': 'medium'
-                        })
+                        self.add_issue(Issue(
+                            'Outdated Dependencies',
+                            file='Package.swift',
+                            issue='Some dependencies may be outdated',
+                            severity='medium'
+                        ), 'medium')
             
-            except Exception as e:
+            except (OSError, UnicodeDecodeError):
                 pass
     
     def check_encryption(self):
         """Check encryption usage and configuration"""
         print("  🔐 Checking encryption...")
         
-        encryption_checks = {
-            'CommonCrypto': 'Using CommonCrypto (legacy)',
-            'CryptoKit': 'Using CryptoKit (recommended)',
-            'SecKey': 'Using SecKey for key management',
-            'Keychain': 'Using Keychain for secure storage',
-        }
-        
-        for root, dirs, files in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'Pods', 'DerivedData', '.build']]
-            
-            for file in files:
-                if file.endswith('.swift'):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                            for crypto_lib, description in encryption_checks.items():
-                                if crypto_lib in content:
-                                    self.results['info'].append({
-                                        'type': 'Encryption',
-                                        'library': crypto_lib,
-                                        'description': description,
-                                        'file': str(file_path.relative_to(self.project_path))
-                                    })
-                    
-                    except Exception as e:
-                        pass
+        self.results['info'].extend(self._merged_findings('encryption'))
+    
+    def _find_encryption(self, file_name: str, lines: LineIndex) -> List[Dict]:
+        """Info entries for the crypto libraries one file uses"""
+        return [{
+            'type': 'Encryption',
+            'library': crypto_lib,
+            'description': description,
+            'file': file_name
+        } for crypto_lib, description in self.encryption_checks.items()
+            if lines.content.find(crypto_lib.encode()) != -1]
     
     def check_authentication(self):
         """Check authentication mechanisms"""
         print("  🔑 Checking authentication...")
         
-        auth_patterns = {
-            'biometric': r'LAContext|evaluatePolicy|biometryType',
-            'oauth': r'OAuth|authorization_code|client_credentials',
-            'jwt': r'JWT|Bearer\s+ey[A-Za-z0-9]',
-            'api_key': r'[Aa]pi[Kk]ey|X-API-Key',
-        }
-        
         auth_found = {}
         
-        for root, dirs, files in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'Pods', 'DerivedData', '.build']]
-            
-            for file in files:
-                if file.endswith('.swift'):
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                            for auth_type, pattern in auth_patterns.items():
-                                if re.search(pattern, content):
-                                    if auth_type not in auth_found:
-                                        auth_found[auth_type] = []
-                                    auth_found[auth_type].append(str(file_path.relative_to(self.project_path)))
-                    
-                    except Exception as e:
-                        pass
+        for auth_type, file_name in self._merged_findings('authentication'):
+            if auth_type not in auth_found:
+                auth_found[auth_type] = []
+            auth_found[auth_type].append(file_name)
         
         if auth_found:
             self.results['info'].append({
@@ -361,6 +438,11 @@ class SecurityAnalyzer:
                 'details': auth_found
             })
     
+    def _find_authentication(self, file_name: str, lines: LineIndex) -> List[Tuple[str, str]]:
+        """(auth_type, file) pairs for the auth mechanisms one file uses"""
+        return [(auth_type, file_name) for auth_type, pattern in self.auth_patterns.items()
+                if self._may_match(pattern, lines.content) and pattern.search(lines.content)]
+    
     def analyze_info_plist(self):
         """Analyze Info.plist for security configurations"""
         print("  📋 Analyzing Info.plist...")
@@ -389,7 +471,7 @@ class SecurityAnalyzer:
                                 'found': True
                             })
             
-            except Exception as e:
+            except (OSError, UnicodeDecodeError):
                 pass
     
     def check_best_practices(self):
@@ -429,41 +511,173 @@ class SecurityAnalyzer:
         
         self.results['best_practices'] = practices
     
+    def _may_match(self, pattern: re.Pattern, content: FileContent) -> bool:
+        """False if content lacks a literal every match of pattern contains"""
+        if pattern is self._hex_run_pattern:
+            # mmap has no translate(); large mapped files are copied out first
+            classes = (content if isinstance(content, bytes) else content[:]).translate(_HEX_CLASS)
+            return classes.find(_HEX_RUN) != -1
+        literal = self._required_literals[pattern]
+        return literal is None or content.find(literal) != -1
+    
+    def _match_patterns(self, file_name: str, lines: LineIndex, patterns: Dict[str, re.Pattern],
+                        make_issue: Callable[[str, LineIndex, str, re.Match], Issue]) -> List[Issue]:
+        """Build an issue with make_issue for every match of every pattern in one file"""
+        return [make_issue(file_name, lines, name, match)
+                for name, pattern in patterns.items()
+                if self._may_match(pattern, lines.content)
+                for match in pattern.finditer(lines.content)]
+    
+    def _check_file(self, file_path: Path) -> Dict[str, list]:
+        """Run the FILE_CHECKS that apply to one file, keyed by check name"""
+        # Every finding in the file reports the same relative path
+        file_name = str(file_path.relative_to(self.project_path))
+        try:
+            content = self._read(file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            # Returned like any other finding so errors from pool workers surface too
+            return {'read_errors': [{'type': 'Read Error', 'file': file_name, 'error': str(e)}]}
+        
+        try:
+            lines = LineIndex(content)
+            return {name: getattr(self, finder)(file_name, lines)
+                    for name, extensions, finder in self.FILE_CHECKS
+                    if file_path.suffix in extensions}
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    
+    def _store_findings(self, file_path: Path, findings: Dict[str, list]):
+        """Cache a file's FILE_CHECKS results, reporting it if it could not be read"""
+        self._file_findings[file_path] = findings
+        self.results['info'].extend(findings.get('read_errors', ()))
+    
+    def _findings_per_file(self, check_name: str) -> Iterator[list]:
+        """Each file's findings for one FILE_CHECKS entry, in walk order"""
+        extensions = next(exts for name, exts, _ in self.FILE_CHECKS if name == check_name)
+        for file_path in self._source_files(extensions):
+            if file_path not in self._file_findings:
+                self._store_findings(file_path, self._check_file(file_path))
+            yield self._file_findings[file_path].get(check_name, [])
+    
+    def _merged_findings(self, check_name: str) -> Iterator:
+        """Findings of one FILE_CHECKS entry across the project, in walk order"""
+        for findings in self._findings_per_file(check_name):
+            yield from findings
+    
+    def _collect_files(self) -> Dict[str, List[Path]]:
+        """Walk the project once, grouping scanned files by extension in walk order"""
+        self._files = []
+        self._files_by_ext.clear()
+        self._file_modes.clear()
+        # Same order as os.walk (a directory's files, then each subdirectory in
+        # turn), but DirEntry type checks come from readdir and Path objects are
+        # only built for files some scan wants
+        stack = [str(self.project_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                
+                # A leading dot alone is not an extension (as with Path.suffix)
+                stem, dot, ext = entry.name.rpartition('.')
+                ext = dot + ext
+                if stem and ext in self.SCANNED_EXTENSIONS:
+                    file_path = Path(entry.path)
+                    self._files.append(file_path)
+                    self._files_by_ext[ext].append(file_path)
+                    if ext in self.SENSITIVE_EXTENSIONS:
+                        try:
+                            self._file_modes[file_path] = entry.stat().st_mode
+                        except OSError:
+                            pass
+            stack.extend(reversed(subdirs))
+        return self._files_by_ext
+    
+    def _source_files(self, extensions: Tuple[str, ...]) -> List[Path]:
+        """Files with any of the given extensions, in walk order"""
+        if self._files is None:
+            self._collect_files()
+        if len(extensions) == 1:
+            return self._files_by_ext[extensions[0]]
+        return [path for path in self._files if path.suffix in extensions]
+    
+    def _read(self, file_path: Path) -> FileContent:
+        """Read or map a source file; raises OSError, or UnicodeDecodeError
+        if it is not UTF-8 text"""
+        content = read_source(file_path)
+        mapped = content if isinstance(content, mmap.mmap) else None
+        try:
+            # Non-UTF-8 files (binary plists, ...) are not scanned
+            self._check_utf8(content)
+            # Match text mode's universal newlines so line numbers agree
+            if content.find(b'\r') != -1:
+                content = content[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        except UnicodeDecodeError:
+            if mapped is not None:
+                mapped.close()
+            raise
+        if mapped is not None and content is not mapped:
+            mapped.close()
+        return content
+    
+    @classmethod
+    def _check_utf8(cls, content: FileContent):
+        """Raise UnicodeDecodeError unless content is valid UTF-8, without
+        keeping a decoded copy of it"""
+        if isinstance(content, bytes):
+            # ASCII needs no check
+            if not content.isascii():
+                str(content, 'utf-8')
+            return
+        
+        # A mapping is checked a chunk at a time so it is never decoded whole;
+        # the incremental decoder carries sequences split across chunks
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for start in range(0, len(content), cls.UTF8_CHECK_CHUNK):
+            chunk = content[start:start + cls.UTF8_CHECK_CHUNK]
+            if not chunk.isascii() or decoder.getstate()[0]:
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    
     def is_false_positive(self, match: str, pattern_name: str) -> bool:
         """Check if a match is likely a false positive"""
-        false_positive_indicators = [
-            'example', 'test', 'mock', 'fake', 'dummy', 'placeholder',
-            'YOUR_', 'XXXX', '...', '***', 'TODO', 'FIXME'
-        ]
-        
-        match_lower = match.lower()
-        return any(indicator.lower() in match_lower for indicator in false_positive_indicators)
+        return self._false_positive_re.search(match) is not None
     
     def get_vulnerability_severity(self, vuln_name: str) -> str:
         """Determine vulnerability severity"""
-        critical = ['sql_injection', 'command_injection']
-        high = ['weak_crypto', 'unsafe_deserialization', 'path_traversal']
-        medium = ['weak_random', 'http_urls', 'debug_enabled']
-        
-        if vuln_name in critical:
-            return 'critical'
-        elif vuln_name in high:
-            return 'high'
-        elif vuln_name in medium:
-            return 'medium'
-        else:
-            return 'low'
+        return self._vuln_severity.get(vuln_name, 'low')
     
-    def add_issue(self, issue: Dict, severity: str):
+    def add_issue(self, issue: Issue, severity: str):
         """Add issue to appropriate severity category"""
-        if severity == 'critical':
-            self.results['critical_issues'].append(issue)
-        elif severity == 'high':
-            self.results['high_issues'].append(issue)
-        elif severity == 'medium':
-            self.results['medium_issues'].append(issue)
-        else:
-            self.results['low_issues'].append(issue)
+        if severity not in self._counts:
+            severity = 'low'
+        self._counts[severity] += 1
+        self.results[severity + '_issues'].append(issue)
+    
+    def _add_file_issues(self, issues: List[Issue]):
+        """Add one file's issues by their own severity, extending each list once"""
+        batches = {severity: [] for severity in self._counts}
+        for issue in issues:
+            batches.get(issue.severity, batches['low']).append(issue)
+        
+        for severity, batch in batches.items():
+            if batch:
+                self._counts[severity] += len(batch)
+                self.results[severity + '_issues'].extend(batch)
     
     def calculate_security_score(self):
         """Calculate overall security score"""
@@ -471,37 +685,38 @@ class SecurityAnalyzer:
         score = 100
         
         # Deduct points based on issues
-        score -= len(self.results['critical_issues']) * 20
-        score -= len(self.results['high_issues']) * 10
-        score -= len(self.results['medium_issues']) * 5
-        score -= len(self.results['low_issues']) * 2
+        counts = self._counts
+        score -= counts['critical'] * 20
+        score -= counts['high'] * 10
+        score -= counts['medium'] * 5
+        score -= counts['low'] * 2
         
         # Ensure score doesn't go below 0
         score = max(0, score)
         
         # Add statistics
         self.results['statistics'] = {
-            'total_issues': sum([
-                len(self.results['critical_issues']),
-                len(self.results['high_issues']),
-                len(self.results['medium_issues']),
-                len(self.results['low_issues'])
-            ]),
-            'critical_count': len(self.results['critical_issues']),
-            'high_count': len(self.results['high_issues']),
-            'medium_count': len(self.results['medium_issues']),
-            'low_count': len(self.results['low_issues']),
-            'files_scanned': len(list(self.project_path.rglob('*.swift')))
+            'total_issues': sum(counts.values()),
+            **{f'{severity}_count': count for severity, count in counts.items()},
+            # The walk already grouped files by extension; no second traversal
+            'files_scanned': len(self._source_files(('.swift',)))
         }
         
         self.results['security_score'] = score
     
-    def export_results(self, output_path: str):
-        """Export results to JSON and Markdown"""
+    def report_data(self) -> Dict[str, Any]:
+        """The results with each Issue converted to its report entry"""
+        data = dict(self.results)
+        for key in ('critical_issues', 'high_issues', 'medium_issues', 'low_issues'):
+            data[key] = [issue.to_dict() for issue in data[key]]
+        return data
+    
+    def export_results(self, output_path: str, compact: bool = False):
+        """Export results to JSON (indented unless compact is set) and Markdown"""
         # Export JSON
         json_path = Path(output_path) / 'security_analysis.json'
-        with open(json_path, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        # The documented hooks grep the indented layout ('"critical_count": 1')
+        write_json(self.report_data(), json_path, pretty=not compact, default=str)
         
         # Export Markdown report
         md_path = Path(output_path) / 'SECURITY_ANALYSIS_REPORT.md'
@@ -533,8 +748,8 @@ class SecurityAnalyzer:
         
         if self.results['critical_issues']:
             for issue in self.results['critical_issues']:
-                report += f"\n### {issue.get('type', 'Issue')}\n"
-                for key, value in issue.items():
+                report += f"\n### {issue.type}\n"
+                for key, value in issue.to_dict().items():
                     if key != 'type':
                         report += f"- **{key.replace('_', ' ').title()}**: {value}\n"
         else:
@@ -543,8 +758,8 @@ class SecurityAnalyzer:
         report += "\n## High Priority Issues\n"
         if self.results['high_issues']:
             for issue in self.results['high_issues'][:10]:  # Limit to first 10
-                report += f"\n### {issue.get('type', 'Issue')}\n"
-                for key, value in issue.items():
+                report += f"\n### {issue.type}\n"
+                for key, value in issue.to_dict().items():
                     if key != 'type':
                         report += f"- **{key.replace('_', ' ').title()}**: {value}\n"
         else:
@@ -576,18 +791,40 @@ class SecurityAnalyzer:
         return report
 
 
+_worker_analyzer: Optional[SecurityAnalyzer] = None
+
+
+def _init_worker(project_path: str):
+    """Build one analyzer per worker process so patterns compile once per worker"""
+    global _worker_analyzer
+    _worker_analyzer = SecurityAnalyzer(project_path, max_workers=1)
+
+
+def _check_file_worker(file_path: Path) -> Dict[str, list]:
+    """Run the per-file checks for one file in a worker process"""
+    return _worker_analyzer._check_file(file_path)
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Security Analyzer for VoiceFlow')
+    parser.add_argument('--serial', action='store_true',
+                        help='Scan files in this process instead of a worker pool')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write the JSON report without indentation'
+                             ' (breaks grep-based critical issue checks)')
+    args = parser.parse_args()
+    
     # Get project root
     project_path = Path.cwd()
     
     # Create analyzer
-    analyzer = SecurityAnalyzer(project_path)
+    analyzer = SecurityAnalyzer(project_path, max_workers=1 if args.serial else None)
     
     # Run analysis
     results = analyzer.analyze()
     
     # Export results
-    analyzer.export_results(project_path)
+    analyzer.export_results(project_path, compact=args.compact)
     
     # Print summary
     print(f"\n{'='*50}")